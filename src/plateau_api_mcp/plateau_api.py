@@ -1,14 +1,49 @@
 import asyncio
+import json
 import os
+import random
 import shutil
+import struct
+import threading
+import time
 import zipfile
 import logging
-from typing import Any, Dict, List, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypedDict, Union
+from urllib.parse import unquote, urlparse
 
 import aiofiles
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+# orjsonはオプション依存（インストールされていない場合は標準ライブラリのjsonを使用）
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+_json_loads = _json.loads
+
+# Numbaはオプション依存（インストールされていない場合は通常のPython関数として実行）
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba未インストール時の代替デコレータ（何もしない）"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # ロガーの設定
 logger = logging.getLogger("plateau-api")
 logger.setLevel(logging.INFO)
@@ -18,12 +53,108 @@ handler = logging.StreamHandler()
 handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logger.addHandler(handler)
 
-# MCPサーバーの初期化
-mcp = FastMCP("PLATEAU-API")
-
 # PLATEAU APIのエンドポイント
 END_POINT = "https://api.plateauview.mlit.go.jp"
 
+# リトライ対象とする4xxステータスコード（Request Timeout / Too Many Requests）
+RETRYABLE_STATUS_CODES = (408, 429)
+
+# リトライ時の最大待機時間（秒）
+RETRY_MAX_DELAY = 30.0
+
+# APIリクエストのデフォルトヘッダー（読み取り専用）
+_DEFAULT_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# ダウンロード時のチャンクサイズ（64KiB）
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# ZIP展開時のコピーバッファサイズ（1MiB）
+EXTRACT_BUFFER_SIZE = 1 << 20
+
+# 緯度・経度1度あたりの5次メッシュ分割数（緯度7.5秒・経度11.25秒単位）
+MESH_LAT_DIVISIONS = 480
+MESH_LON_DIVISIONS = 320
+
+# メッシュレベルごとのメッシュコードの書式
+MESH_CODE_FORMATS = (
+    "{0:02d}{1:02d}",
+    "{0:02d}{1:02d}{2}{3}",
+    "{0:02d}{1:02d}{2}{3}{4}{5}",
+    "{0:02d}{1:02d}{2}{3}{4}{5}{6}",
+    "{0:02d}{1:02d}{2}{3}{4}{5}{6}{7}",
+)
+
+# ZIP展開時の最大スレッド数
+EXTRACT_MAX_WORKERS = 8
+# 並列展開を行う最小ファイル数（これ未満は逐次展開）
+EXTRACT_PARALLEL_MIN_FILES = 4
+
+# 一括取得時の同時リクエスト数の上限
+_SEM = asyncio.Semaphore(16)
+
+# GETレスポンスのキャッシュ有効期間（秒）
+CACHE_TTL = 60.0
+# ZIP化ステータスは変化するため短めに設定
+PACK_STATUS_CACHE_TTL = 2.0
+# キャッシュの最大エントリ数
+CACHE_MAX_ENTRIES = 256
+
+# GETレスポンスのキャッシュ（キー -> (有効期限, 値)）
+_cache: Dict[tuple, Tuple[float, Any]] = {}
+_cache_lock = asyncio.Lock()
+
+# 全ツールで共有するHTTPクライアント（初回使用時に生成）
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    共有のHTTPクライアントを取得する内部ヘルパー関数。
+
+    接続プールを使い回すことで、リクエストごとのTCP/TLS接続確立を省略します。
+    HTTP/2を有効にし、並行リクエストを1つの接続に多重化します。
+    レスポンスの圧縮（gzip、および`brotli`インストール時はbr）はhttpxが自動でネゴシエーション・展開します。
+
+    Returns:
+        httpx.AsyncClient: 共有のHTTPクライアント。
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            http2=True,
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """共有のHTTPクライアントをクローズする"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """サーバー終了時に共有HTTPクライアントをクローズする"""
+    try:
+        yield
+    finally:
+        await _close_client()
+
+
+# MCPサーバーの初期化
+mcp = FastMCP("PLATEAU-API", lifespan=_lifespan)
+
+
+@lru_cache(maxsize=2048)
+def _build_url(path: str) -> str:
+    """APIエンドポイントのパスからURLを生成する（同じパスの結果はキャッシュ）"""
+    return END_POINT + path
+
 
 class PackResponse(TypedDict):
     id: str
@@ -34,7 +165,7 @@ async def fetch_api(
     params: Dict[str, Any] = None,
     json_body: Dict[str, Any] = None,
     retries: int = 3,
-    headers: Dict[str, str] = None,
+    headers: Mapping[str, str] = None,
     expect_json: bool = True  # JSON解析を期待するかどうかの新しいパラメータ
 ) -> Any:
     """
@@ -48,50 +179,154 @@ async def fetch_api(
         method (str): HTTPメソッド（"GET"または"POST"）。デフォルトは"GET"。
         params (Dict[str, Any], optional): クエリパラメータ。デフォルトはNone。
         json_body (Dict[str, Any], optional): POSTリクエスト時のJSON Body。デフォルトはNone。
-        retries (int): エラー発生時のリトライ回数。デフォルトは3。
-        headers (Dict[str, str], optional): カスタムヘッダー。デフォルトはNone。
+        retries (int): エラー発生時の試行回数（GETのみ。POSTはリトライしない）。デフォルトは3。
+        headers (Mapping[str, str], optional): カスタムヘッダー。デフォルトはNone。
         expect_json (bool): JSONレスポンスを期待する場合はTrue。デフォルトはTrue。
 
     Returns:
         Any: レスポンスのJSONデータまたは生レスポンス。
     """
-    url = END_POINT + path
+    url = _build_url(path)
 
     # デフォルトヘッダーを設定
     if headers is None:
-        headers = {"Content-Type": "application/json"}
-
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for attempt in range(retries):
-            try:
-                if method.upper() == "GET":
-                    resp = await client.get(url, headers=headers, params=params)
-                else:
-                    resp = await client.post(url, headers=headers, json=json_body)
-                resp.raise_for_status()
-
-                if expect_json:
-                    return resp.json()
-                else:
-                    # JSON以外のレスポンスの場合は生レスポンスを返す
-                    return resp
-            except httpx.HTTPStatusError as e:
-                error_details = resp.text
-                logger.error(f"HTTPエラー発生: {e}. 詳細: {error_details}")
-                if resp.status_code == 403:
-                    logger.error("403 Forbiddenエラー: アクセス権限を確認してください。")
-                if attempt < retries - 1:
-                    logger.info(f"リトライ中... ({attempt + 1}/{retries})")
-                    await asyncio.sleep(2)  # リトライ間隔を2秒に設定
-                else:
-                    raise RuntimeError(f"APIリクエスト失敗: {e}. 詳細: {error_details}")
-            except Exception as e:
-                logger.error(f"予期しないエラーが発生しました: {e}")
+        headers = _DEFAULT_HEADERS
+
+    # POSTは冪等ではない（再送するとpackジョブが重複する）ため、GETのみリトライする
+    is_get = method.upper() == "GET"
+
+    client = _get_client()
+    for attempt in range(retries):
+        try:
+            if is_get:
+                resp = await client.get(url, headers=headers, params=params)
+            else:
+                resp = await client.post(url, headers=headers, json=json_body)
+            resp.raise_for_status()
+
+            if expect_json:
+                return _json_loads(resp.content)
+            else:
+                # JSON以外のレスポンスの場合は生レスポンスを返す
+                return resp
+        except httpx.HTTPStatusError as e:
+            error_details = resp.text
+            logger.error(f"HTTPエラー発生: {e}. 詳細: {error_details}")
+            if resp.status_code == 403:
+                logger.error("403 Forbiddenエラー: アクセス権限を確認してください。")
+            # 408/429以外の4xxはリトライしても結果が変わらないため即座に失敗とする
+            retryable = not (400 <= resp.status_code < 500) or resp.status_code in RETRYABLE_STATUS_CODES
+            if is_get and retryable and attempt < retries - 1:
+                delay = _retry_delay(attempt, resp.headers.get("retry-after"))
+                logger.info(f"リトライ中... ({attempt + 1}/{retries}, {delay:.1f}秒後)")
+                await asyncio.sleep(delay)
+            else:
+                raise RuntimeError(f"APIリクエスト失敗: {e}. 詳細: {error_details}")
+        except httpx.TransportError as e:
+            logger.error(f"通信エラーが発生しました: {e}")
+            if is_get and attempt < retries - 1:
+                delay = _retry_delay(attempt)
+                logger.info(f"リトライ中... ({attempt + 1}/{retries}, {delay:.1f}秒後)")
+                await asyncio.sleep(delay)
+            else:
                 raise
 
 
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    リトライまでの待機時間を計算する内部ヘルパー関数。
+
+    `Retry-After`ヘッダー（秒数）があればそれに従い、なければジッター付きの指数バックオフとします。
+
+    Args:
+        attempt (int): 何回目の試行か（0始まり）。
+        retry_after (str, optional): レスポンスの`Retry-After`ヘッダーの値。
+
+    Returns:
+        float: 待機時間（秒）。
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            # HTTP日付形式などの場合は指数バックオフにフォールバック
+            pass
+    return min(2 ** attempt, RETRY_MAX_DELAY) + random.uniform(0, 0.5)
+
+
+async def _cached_fetch(key: tuple, coro_factory: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+    """
+    TTL付きキャッシュを介して非同期処理の結果を取得する内部ヘルパー関数。
+
+    有効期限内のキャッシュがあればそれを返し、なければ`coro_factory`を実行して結果をキャッシュします。
+    期限切れのエントリは参照時に削除します。
+
+    Args:
+        key (tuple): キャッシュキー。
+        coro_factory (Callable[[], Awaitable[Any]]): キャッシュがない場合に実行するコルーチンを返す関数。
+        ttl (float): キャッシュの有効期間（秒）。
+
+    Returns:
+        Any: キャッシュされた値、または`coro_factory`の実行結果。
+    """
+    async with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                return entry[1]
+            del _cache[key]
+
+    value = await coro_factory()
+
+    async with _cache_lock:
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            # 最も古いエントリから削除
+            del _cache[next(iter(_cache))]
+        _cache[key] = (time.monotonic() + ttl, value)
+    return value
+
+
+async def fetch_api_cached(path: str, params: Dict[str, Any] = None, ttl: float = CACHE_TTL) -> Any:
+    """
+    キャッシュ付きのGETリクエストヘルパー。
+
+    同一のパス・クエリパラメータに対するリクエストは、有効期間内であればキャッシュから返します。
+
+    Args:
+        path (str): APIエンドポイントのパス。
+        params (Dict[str, Any], optional): クエリパラメータ。デフォルトはNone。
+        ttl (float): キャッシュの有効期間（秒）。デフォルトは`CACHE_TTL`。
+
+    Returns:
+        Any: レスポンスのJSONデータ。
+    """
+    key = (path, tuple(sorted(params.items())) if params else ())
+    return await _cached_fetch(key, lambda: fetch_api(path, params=params), ttl)
+
+
+async def fetch_api_many(paths: List[str], ttl: float = CACHE_TTL) -> List[Any]:
+    """
+    複数のパスに対するGETリクエストを並行して実行するヘルパー。
+
+    同時リクエスト数はセマフォで制限します。失敗したリクエストは例外オブジェクトとして
+    結果リストに格納されるため、呼び出し側で判定してください。
+
+    Args:
+        paths (List[str]): APIエンドポイントのパスのリスト。
+        ttl (float): キャッシュの有効期間（秒）。デフォルトは`CACHE_TTL`。
+
+    Returns:
+        List[Any]: 各パスに対応するレスポンスのJSONデータまたは例外（入力と同じ順序）。
+    """
+    async def one(path: str) -> Any:
+        async with _SEM:
+            return await fetch_api_cached(path, ttl=ttl)
+
+    return await asyncio.gather(*(one(path) for path in paths), return_exceptions=True)
+
+
 @mcp.tool()
-async def get_mesh_code(lat: float, lon: float, mesh_order: int = 2) -> str:
+def get_mesh_code(lat: float, lon: float, mesh_order: int = 2) -> str:
     """
     緯度経度から指定レベルのメッシュコードを取得。ユーザから指定が無い限りは2次メッシュコードを返す。
 
@@ -114,81 +349,128 @@ async def get_mesh_code(lat: float, lon: float, mesh_order: int = 2) -> str:
         ValueError: 入力値が範囲外の場合
     """
     # 入力値検証
-    if not (20 <= lat <= 46):
-        raise ValueError("緯度は20～46度の範囲で入力してください（日本の範囲）")
-    if not (122 <= lon <= 154):
-        raise ValueError("経度は122～154度の範囲で入力してください（日本の範囲）")
-    if not (1 <= mesh_order <= 5):
-        raise ValueError("mesh_orderは1～5の値を指定してください")
+    _validate_mesh_input(lat, lon, mesh_order)
 
-    # 1次メッシュコード計算（約80km四方）
-    # 緯度: 40分（2/3度）単位で分割
-    # 経度: 1度単位で分割
-    lat_first_code = int(lat * 60 // 40)  # 緯度方向のコード（40分単位）
-    lon_first_code = int(lon - 100)       # 経度方向のコード（東経100度からの差）
-    mesh_code = f"{lat_first_code:02d}{lon_first_code:02d}"
+    return _format_mesh_code(_mesh_indices(lat, lon), mesh_order)
 
-    if mesh_order == 1:
-        return mesh_code
 
-    # 2次メッシュコード計算（約10km四方）
-    # 1次メッシュを緯度・経度方向に8分割
-    lat_remainder_1st = lat * 60 - lat_first_code * 40  # 1次メッシュ内での緯度残り（分）
-    lat_second_code = int(lat_remainder_1st // 5)       # 緯度方向のコード（5分単位）
-
-    lon_remainder_1st = lon - 100 - lon_first_code      # 1次メッシュ内での経度残り（度）
-    lon_second_code = int(lon_remainder_1st * 60 // 7.5)  # 経度方向のコード（7.5分単位）
-
-    mesh_code += f"{lat_second_code}{lon_second_code}"
-
-    if mesh_order == 2:
-        return mesh_code
-
-    # 3次メッシュコード計算（約1km四方）
-    # 2次メッシュを緯度・経度方向に10分割
-    lat_remainder_2nd = lat_remainder_1st - lat_second_code * 5  # 2次メッシュ内での緯度残り（分）
-    lat_third_code = int(lat_remainder_2nd * 60 // 30)           # 緯度方向のコード（30秒単位）
-
-    lon_remainder_2nd = lon_remainder_1st * 60 - lon_second_code * 7.5  # 2次メッシュ内での経度残り（分）
-    lon_third_code = int(lon_remainder_2nd * 60 // 45)                  # 経度方向のコード（45秒単位）
+@mcp.tool()
+def get_mesh_codes(lats: List[float], lons: List[float], mesh_order: int = 2) -> List[str]:
+    """
+    複数の緯度経度から指定レベルのメッシュコードをまとめて取得。
 
-    mesh_code += f"{lat_third_code}{lon_third_code}"
+    広い範囲を対象とする場合など、多数の地点をメッシュコードに変換する際に使用します。
+    Numbaがインストールされている場合は並列計算で高速に変換します。
 
-    if mesh_order == 3:
-        return mesh_code
+    Args:
+        lats (List[float]): 緯度（度）のリスト
+        lons (List[float]): 経度（度）のリスト。`lats`と同じ長さであること。
+        mesh_order (int): メッシュレベル（1～5）を指定。デフォルトは2。
 
-    # 4次メッシュコード計算（約500m四方）
-    # 3次メッシュを緯度・経度方向に2分割
-    lat_remainder_3rd = lat_remainder_2nd * 60 - lat_third_code * 30  # 3次メッシュ内での緯度残り（秒）
-    lat_fourth_index = int(lat_remainder_3rd // 15)                   # 緯度方向の分割インデックス（15秒単位）
+    Returns:
+        List[str]: 入力と同じ順序のメッシュコードのリスト
 
-    lon_remainder_3rd = lon_remainder_2nd * 60 - lon_third_code * 45  # 3次メッシュ内での経度残り（秒）
-    lon_fourth_index = int(lon_remainder_3rd // 22.5)                 # 経度方向の分割インデックス（22.5秒単位）
+    Raises:
+        ValueError: 入力値が範囲外の場合、または緯度と経度のリストの長さが異なる場合
+    """
+    if len(lats) != len(lons):
+        raise ValueError("latsとlonsは同じ長さのリストを指定してください")
+    for lat, lon in zip(lats, lons):
+        _validate_mesh_input(lat, lon, mesh_order)
+
+    if NUMBA_AVAILABLE:
+        indices = _mesh_indices_batch(
+            np.asarray(lats, dtype=np.float64),
+            np.asarray(lons, dtype=np.float64)
+        ).tolist()
+    else:
+        indices = [_mesh_indices(lat, lon) for lat, lon in zip(lats, lons)]
 
-    # 4次メッシュは2x2の4分割を1〜4の番号で表現
-    fourth_mesh_number = lat_fourth_index * 2 + lon_fourth_index + 1
-    mesh_code += str(fourth_mesh_number)
+    return [_format_mesh_code(index, mesh_order) for index in indices]
 
-    if mesh_order == 4:
-        return mesh_code
 
-    # 5次メッシュコード計算（約250m四方）
-    # 4次メッシュを緯度・経度方向に2分割
-    lat_remainder_4th = lat_remainder_3rd - lat_fourth_index * 15     # 4次メッシュ内での緯度残り（秒）
-    lat_fifth_index = int(lat_remainder_4th // 7.5)                  # 緯度方向の分割インデックス（7.5秒単位）
+def _validate_mesh_input(lat: float, lon: float, mesh_order: int) -> None:
+    """メッシュコード計算の入力値を検証する"""
+    if not (20 <= lat <= 46):
+        raise ValueError("緯度は20～46度の範囲で入力してください（日本の範囲）")
+    if not (122 <= lon <= 154):
+        raise ValueError("経度は122～154度の範囲で入力してください（日本の範囲）")
+    if not (1 <= mesh_order <= 5):
+        raise ValueError("mesh_orderは1～5の値を指定してください")
 
-    lon_remainder_4th = lon_remainder_3rd - lon_fourth_index * 22.5   # 4次メッシュ内での経度残り（秒）
-    lon_fifth_index = int(lon_remainder_4th // 11.25)                # 経度方向の分割インデックス（11.25秒単位）
 
-    # 5次メッシュは2x2の4分割を1〜4の番号で表現
-    fifth_mesh_number = lat_fifth_index * 2 + lon_fifth_index + 1
-    mesh_code += str(fifth_mesh_number)
+@njit(cache=True)
+def _mesh_indices(lat: float, lon: float) -> Tuple[int, int, int, int, int, int, int, int, int, int]:
+    """
+    緯度経度から1次～5次メッシュの緯度・経度方向のインデックスを計算する。
 
-    return mesh_code
+    Returns:
+        Tuple[int, ...]: (1次緯度, 1次経度, 2次緯度, 2次経度, 3次緯度, 3次経度,
+                          4次緯度, 4次経度, 5次緯度, 5次経度)
+    """
+    # 5次メッシュの1辺（緯度7.5秒・経度11.25秒）を単位とした整数インデックスに変換
+    # 以降の各レベルは整数の商と余りから求める
+    lat_index = int(lat * MESH_LAT_DIVISIONS)
+    lon_index = int((lon - 100) * MESH_LON_DIVISIONS)
+
+    # 1次メッシュ（緯度40分・経度1度）: 320単位
+    # 2次メッシュ（緯度5分・経度7.5分）: 40単位
+    # 3次メッシュ（緯度30秒・経度45秒）: 4単位
+    # 4次・5次メッシュ: 2x2分割
+    lat_first_code, lat_remainder = divmod(lat_index, 320)
+    lat_second_code, lat_remainder = divmod(lat_remainder, 40)
+    lat_third_code, lat_remainder = divmod(lat_remainder, 4)
+    lat_fourth_index, lat_fifth_index = divmod(lat_remainder, 2)
+
+    lon_first_code, lon_remainder = divmod(lon_index, 320)
+    lon_second_code, lon_remainder = divmod(lon_remainder, 40)
+    lon_third_code, lon_remainder = divmod(lon_remainder, 4)
+    lon_fourth_index, lon_fifth_index = divmod(lon_remainder, 2)
+
+    return (
+        lat_first_code, lon_first_code,
+        lat_second_code, lon_second_code,
+        lat_third_code, lon_third_code,
+        lat_fourth_index, lon_fourth_index,
+        lat_fifth_index, lon_fifth_index,
+    )
+
+
+@njit(cache=True, parallel=True)
+def _mesh_indices_batch(lats, lons):
+    """`_mesh_indices`のバッチ版。Numbaが利用可能な場合のみ使用する。"""
+    n = lats.shape[0]
+    out = np.empty((n, 10), dtype=np.int64)
+    for i in prange(n):
+        index = _mesh_indices(lats[i], lons[i])
+        for j in range(10):
+            out[i, j] = index[j]
+    return out
+
+
+def _format_mesh_code(index: Sequence[int], mesh_order: int) -> str:
+    """`_mesh_indices`の計算結果から指定レベルのメッシュコード文字列を生成する"""
+    (lat_first_code, lon_first_code,
+     lat_second_code, lon_second_code,
+     lat_third_code, lon_third_code,
+     lat_fourth_index, lon_fourth_index,
+     lat_fifth_index, lon_fifth_index) = index
+
+    # 4次・5次メッシュは2x2の4分割を1〜4の番号で表現
+    return MESH_CODE_FORMATS[mesh_order - 1].format(
+        lat_first_code, lon_first_code,
+        lat_second_code, lon_second_code,
+        lat_third_code, lon_third_code,
+        lat_fourth_index * 2 + lon_fourth_index + 1,
+        lat_fifth_index * 2 + lon_fifth_index + 1,
+    )
 
 
 @mcp.tool()
-async def get_list_citygml(conditions: str, feature_type: str) -> List[str]:
+async def get_list_citygml(
+    conditions: Union[str, List[str]],
+    feature_type: str
+) -> Union[List[str], Dict[str, Any]]:
     """
     指定条件でCityGMLファイル一覧を取得し、指定された地物のURLリストを返します。
 
@@ -198,10 +480,14 @@ async def get_list_citygml(conditions: str, feature_type: str) -> List[str]:
     指定された条件（メッシュコードもしくは自治体コード）に基づいて、CityGMLファイルのリストを取得し、
     指定された地物のURLのみをフィルタリングして返します。
 
+    複数の条件をリストで指定した場合は、並行して取得した結果をまとめて返します。
+    一部の条件の取得に失敗した場合は、失敗した条件とエラー内容を`failed_conditions`で返します。
+
     Args:
-        conditions (str): 
+        conditions (str | List[str]): 
             - 三次メッシュコード (例: 'm:53394611')  
             - 自治体コード (例: '13101')  
+            - 上記のリスト (例: ['m:53394611', 'm:53394612'])  
         feature_type (str): ダウンロードしたい地物の記号。以下のいずれかを指定してください。
             - 'bldg': 建築物
             - 'tran': 道路
@@ -218,23 +504,52 @@ async def get_list_citygml(conditions: str, feature_type: str) -> List[str]:
             - 'dem': 地形（起伏）
 
     Returns:
-        List[str]: 指定された地物のURLリスト。該当するURLがない場合は空のリストを返します。
+        List[str] | Dict[str, Any]:
+            - `conditions`が文字列の場合: 指定された地物のURLリスト。該当するURLがない場合は空のリストを返します。
+            - `conditions`がリストの場合: {
+                "urls": List[str],                    # 指定された地物のURLリスト
+                "failed_conditions": Dict[str, str]   # 取得に失敗した条件とエラーメッセージ
+              }
+
+    Raises:
+        RuntimeError: APIリクエストに失敗した場合（リスト指定時は全ての条件で失敗した場合）
     """
     # APIからCityGMLファイル一覧を取得
-    response = await fetch_api(f"/datacatalog/citygml/{conditions}")
-    filtered_urls = []
+    failed_conditions = {}
+    if isinstance(conditions, str):
+        responses = [await fetch_api_cached(f"/datacatalog/citygml/{conditions}")]
+    else:
+        responses = []
+        results = await fetch_api_many([f"/datacatalog/citygml/{c}" for c in conditions])
+        for condition, result in zip(conditions, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"条件 '{condition}' の取得に失敗しました: {result}")
+                failed_conditions[condition] = str(result)
+                continue
+            responses.append(result)
+
+        # 全ての条件で失敗した場合は「データなし」と区別できるよう例外とする
+        if conditions and len(failed_conditions) == len(conditions):
+            details = ", ".join(f"'{c}': {e}" for c, e in failed_conditions.items())
+            raise RuntimeError(f"全ての条件でCityGMLファイル一覧の取得に失敗しました: {details}")
 
     # 指定された地物のURLのみをフィルタリング
-    for city in response.get("cities", []):
-        files = city.get("files", {}).get(feature_type, [])
-        filtered_urls.extend(file["url"] for file in files)
+    cities = chain.from_iterable(response.get("cities") or () for response in responses)
+    filtered_urls = [
+        file["url"]
+        for file in chain.from_iterable((city.get("files") or {}).get(feature_type) or () for city in cities)
+    ]
 
     # URLリストが空の場合の処理
     if len(filtered_urls) == 0:
         logger.warning(f"指定された条件 '{conditions}' に対して地物 '{feature_type}' のデータが見つかりませんでした。")
-        return []
 
-    return filtered_urls
+    if isinstance(conditions, str):
+        return filtered_urls
+    return {
+        "urls": filtered_urls,
+        "failed_conditions": failed_conditions
+    }
 
 
 @mcp.tool()
@@ -269,7 +584,28 @@ async def get_pack_status(id: str) -> Dict[str, Any]:
                         - "succeeded": 成功
                         - "failed": 失敗
     """
-    return await fetch_api(f"/citygml/pack/{id}/status")
+    return await fetch_api_cached(f"/citygml/pack/{id}/status", ttl=PACK_STATUS_CACHE_TTL)
+
+
+@mcp.tool()
+async def get_pack_status_bulk(ids: List[str]) -> Dict[str, Any]:
+    """
+    複数のpackリクエストのZIP生成ステータスをまとめて取得。
+
+    指定された複数のリクエストIDのステータスを並行して取得します。
+
+    Args:
+        ids (List[str]): packリクエストのIDのリスト。
+
+    Returns:
+        Dict[str, Any]: リクエストIDをキーとしたステータス情報。
+                        取得に失敗したIDは`{"error": エラーメッセージ}`となります。
+    """
+    results = await fetch_api_many([f"/citygml/pack/{id}/status" for id in ids], ttl=PACK_STATUS_CACHE_TTL)
+    return {
+        id: {"error": str(result)} if isinstance(result, BaseException) else result
+        for id, result in zip(ids, results)
+    }
 
 
 @mcp.tool()
@@ -304,6 +640,8 @@ async def download_files(download_url: str, save_dir: str, mesh_code: str = None
     指定されたダウンロードURLからZIPファイルを非同期でダウンロード。
 
     `get_packed_download_url`で取得したダウンロードURLを使用してZIPファイルをダウンロードします。
+    保存先に同じファイルがダウンロード済みの場合は、ETag/Last-Modifiedによる条件付きリクエストを行い、
+    サーバー上のファイルが更新されていなければ再ダウンロードしません。
 
     Args:
         download_url (str): ダウンロード対象のURL（get_pack_downloadで取得したURL）。
@@ -315,6 +653,7 @@ async def download_files(download_url: str, save_dir: str, mesh_code: str = None
     Returns:
         Dict[str, Any]: ダウンロード結果の詳細情報
             - zip_path: ダウンロードしたZIPファイルのパス
+            - cached: ダウンロード済みのファイルを再利用した場合はTrue
             - extract_result: auto_extractがTrueの場合の展開結果（`_extract_citygml_files`関数の戻り値）
     """
     # ダウンロード先ディレクトリを作成
@@ -322,8 +661,6 @@ async def download_files(download_url: str, save_dir: str, mesh_code: str = None
 
     # 意味のあるファイル名を生成
     if mesh_code and feature_types:
-        from datetime import datetime
-
         # 現在の日付を取得（yyyymmdd形式）
         current_date = datetime.now().strftime("%Y%m%d")
         # 地物種別を結合（例: "bldg-brid"）
@@ -332,7 +669,6 @@ async def download_files(download_url: str, save_dir: str, mesh_code: str = None
         filename = f"{mesh_code}_{feature_str}_{current_date}.zip"
     else:
         # メッシュコードや地物種別が指定されていない場合はURLから抽出
-        from urllib.parse import unquote, urlparse
         parsed_url = urlparse(download_url)
         filename = os.path.basename(parsed_url.path)
         filename = unquote(filename)
@@ -343,38 +679,119 @@ async def download_files(download_url: str, save_dir: str, mesh_code: str = None
 
     save_path = os.path.join(save_dir, filename)
 
-    async with httpx.AsyncClient() as client:
-        logger.info(f"ダウンロード中: {download_url} -> {save_path}")
-        try:
-            # ZIPファイルを非同期でダウンロード
-            response = await client.get(download_url)
-            response.raise_for_status()
+    meta_path = f"{save_path}.meta.json"
+    # ダウンロード途中のデータは一時ファイルに書き込み、完了後に置き換える
+    part_path = f"{save_path}.part"
 
-            async with aiofiles.open(save_path, mode="wb") as f:
-                await f.write(response.content)
+    # ZIPは圧縮済みのため、転送時の再圧縮は要求しない
+    request_headers = {"Accept-Encoding": "identity"}
 
-            logger.info(f"ダウンロード完了: {save_path}")
+    # ダウンロード済みのファイルがあれば条件付きリクエストにする
+    meta = await _load_download_meta(save_path, meta_path)
+    if meta:
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
 
-            # 結果を格納する辞書
-            result = {
-                "zip_path": save_path,
-                "success": True
-            }
+    client = _get_client()
+    logger.info(f"ダウンロード中: {download_url} -> {save_path}")
+    try:
+        # ZIPファイルをチャンク単位で非同期にダウンロードし、逐次書き込む
+        async with client.stream("GET", download_url, headers=request_headers) as response:
+            # 304はraise_for_statusで例外となるため、ステータス判定より先に処理する
+            cached = response.status_code == 304
+            if cached:
+                logger.info(f"ファイルは更新されていないため、ダウンロード済みのファイルを使用: {save_path}")
+            else:
+                response.raise_for_status()
+
+                size = 0
+                async with aiofiles.open(part_path, mode="wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                        size += len(chunk)
+
+                # 全チャンクの書き込み完了後に置き換え、失敗時に既存のZIPを壊さないようにする
+                os.replace(part_path, save_path)
+
+                # 次回の条件付きリクエスト用にメタ情報を更新
+                # ZIPの置き換え後に行うため、ダウンロードが中断された場合は以前のZIPとメタ情報の組が残る
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                if etag or last_modified:
+                    meta_part_path = f"{meta_path}.part"
+                    async with aiofiles.open(meta_part_path, mode="w", encoding="utf-8") as f:
+                        await f.write(json.dumps({
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "size": size
+                        }))
+                    os.replace(meta_part_path, meta_path)
+                elif os.path.exists(meta_path):
+                    # 新しいZIPに対応しない古いメタ情報は削除
+                    os.remove(meta_path)
+
+                logger.info(f"ダウンロード完了: {save_path}")
+
+        # 結果を格納する辞書
+        result = {
+            "zip_path": save_path,
+            "cached": cached,
+            "success": True
+        }
 
-            # 自動展開が有効な場合はGMLファイルを展開
-            if auto_extract:
+        # 自動展開が有効な場合はGMLファイルを展開
+        if auto_extract:
+            extract_dir = _get_extract_dir(save_path)
+            if cached and os.path.isdir(extract_dir):
+                # 展開済みのディレクトリがあればそのまま使用
+                extract_result = _list_extracted_gml_files(save_path)
+                logger.info(f"展開済みのディレクトリを使用: {extract_dir}")
+            else:
                 logger.info("自動展開を開始...")
                 extract_result = await _extract_gml_files_flat(save_path)
-                result["extract_result"] = extract_result
                 logger.info(f"自動展開完了: {extract_result['total_files']}個のGMLファイルを展開")
+            result["extract_result"] = extract_result
+
+        return result
+
+    except Exception as e:
+        # 書き込み途中の一時ファイルを削除
+        for path in (part_path, f"{meta_path}.part"):
+            if os.path.exists(path):
+                os.remove(path)
+        # ダウンロード失敗時のエラーメッセージ
+        error_msg = f"ダウンロード失敗: {download_url}. エラー: {e}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+
+async def _load_download_meta(save_path: str, meta_path: str) -> Optional[Dict[str, Any]]:
+    """
+    ダウンロード済みファイルのメタ情報（ETag等）を読み込む内部ヘルパー関数。
+
+    Args:
+        save_path (str): ダウンロード済みのZIPファイルパス。
+        meta_path (str): メタ情報ファイルのパス。
 
-            return result
+    Returns:
+        Optional[Dict[str, Any]]: メタ情報。ファイルが存在しない、またはサイズが一致しない場合はNone。
+    """
+    if not (os.path.exists(save_path) and os.path.exists(meta_path)):
+        return None
+
+    try:
+        async with aiofiles.open(meta_path, mode="r", encoding="utf-8") as f:
+            meta = json.loads(await f.read())
+    except (OSError, ValueError) as e:
+        logger.warning(f"メタ情報の読み込みに失敗しました: {meta_path}. エラー: {e}")
+        return None
 
-        except Exception as e:
-            # ダウンロード失敗時のエラーメッセージ
-            error_msg = f"ダウンロード失敗: {download_url}. エラー: {e}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
+    # 書き込みが途中で中断されたファイルは再利用しない
+    if meta.get("size") != os.path.getsize(save_path):
+        return None
+    return meta
 
 
 @mcp.tool()
@@ -400,7 +817,7 @@ async def get_attributes(
     params = {"url": url, "id": id}
     if skip_code_list_fetch:
         params["skip_code_list_fetch"] = "true"
-    return await fetch_api("/citygml/attributes", params=params)
+    return await fetch_api_cached("/citygml/attributes", params=params)
 
 
 @mcp.tool()
@@ -417,7 +834,7 @@ async def get_features(url: str, sid: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: 地物IDリスト。
     """
-    return await fetch_api("/citygml/features", params={"url": url, "sid": sid})
+    return await fetch_api_cached("/citygml/features", params={"url": url, "sid": sid})
 
 
 @mcp.tool()
@@ -443,16 +860,18 @@ async def get_spatialid_attributes(
     params = {"sid": sid, "type": type}
     if skip_code_list_fetch:
         params["skip_code_list_fetch"] = "true"
-    return await fetch_api("/citygml/spatialid_attributes", params=params)
+    return await fetch_api_cached("/citygml/spatialid_attributes", params=params)
 
 
 class QGISCommand:
+    __slots__ = ("_initialized", "_qgis_available")
+
     def __init__(self):
         self._initialized = False
         self._qgis_available = False
 
-    async def initialize(self):
-        """QGISとの接続を初期化する"""
+    def _ensure_initialized(self):
+        """QGISとの接続を初期化する（I/Oを伴わないため同期処理）"""
         if self._initialized:
             return
 
@@ -469,6 +888,14 @@ class QGISCommand:
         """QGISが利用可能かどうかを返す"""
         return self._qgis_available
 
+# QGISのPythonコンソールで実行するコマンドのテンプレート
+# パスはreprで埋め込み、引用符やバックスラッシュを含む場合も有効なPythonリテラルとする
+QGIS_COMMAND_TEMPLATE = (
+    "processing.runAndLoadResults(\"plateau_plugin:load_as_vector\", "
+    "{{'INPUT': {path!r}, 'LOD_PREFERENCE': {lod}, 'SEMANTIC_PARTS': {semantic_parts}, "
+    "'FORCE_2D': False, 'APPEND_MODE': True, 'CRS': QgsCoordinateReferenceSystem('EPSG:6668')}})"
+)
+
 # QGISコマンドのインスタンスを生成
 qgis_command = QGISCommand()
 
@@ -501,10 +928,14 @@ async def show_qgis_download_citygml(
     """
     # 初回実行時のみQGISとの接続を初期化
     if not qgis_command._initialized:
-        await qgis_command.initialize()
+        qgis_command._ensure_initialized()
 
     # QGISのPythonコンソールで実行可能な1行コマンドを生成
-    cmd = f"processing.runAndLoadResults(\"plateau_plugin:load_as_vector\", {{'INPUT': '{citygml_path}', 'LOD_PREFERENCE': {lod_preference}, 'SEMANTIC_PARTS': {str(semantic_parts)}, 'FORCE_2D': False, 'APPEND_MODE': True, 'CRS': QgsCoordinateReferenceSystem('EPSG:6668')}})"
+    cmd = QGIS_COMMAND_TEMPLATE.format(
+        path=citygml_path,
+        lod=int(lod_preference),
+        semantic_parts=bool(semantic_parts)
+    )
 
     return {
         "command": cmd,
@@ -519,6 +950,21 @@ async def _extract_gml_files_flat(zip_path: str) -> Dict[str, Any]:
     """
     ZIPファイルからGMLファイルのみを抽出し、フラット構造で配置する内部ヘルパー関数。
 
+    展開処理はブロッキングI/Oのため、イベントループを止めないよう別スレッドで実行します。
+
+    Args:
+        zip_path (str): 展開対象のZIPファイルパス。
+
+    Returns:
+        Dict[str, Any]: 展開結果の詳細情報
+    """
+    return await asyncio.to_thread(_extract_gml_files_flat_sync, zip_path)
+
+
+def _extract_gml_files_flat_sync(zip_path: str) -> Dict[str, Any]:
+    """
+    `_extract_gml_files_flat`の同期版。ZIPファイルからGMLファイルのみを抽出し、フラット構造で配置する。
+
     Args:
         zip_path (str): 展開対象のZIPファイルパス。
 
@@ -529,10 +975,8 @@ async def _extract_gml_files_flat(zip_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"ZIPファイルが見つかりません: {zip_path}")
 
     # ZIPファイル名から展開先ディレクトリ名を生成
-    zip_dir = os.path.dirname(zip_path)
     zip_filename = os.path.basename(zip_path)
-    zip_name_without_ext = os.path.splitext(zip_filename)[0]
-    extract_dir = os.path.join(zip_dir, f"extract_{zip_name_without_ext}")
+    extract_dir = _get_extract_dir(zip_path)
 
     logger.info(f"ZIPファイル展開中: {zip_path}")
     logger.info(f"展開先ディレクトリ: {extract_dir}")
@@ -543,42 +987,52 @@ async def _extract_gml_files_flat(zip_path: str) -> Dict[str, Any]:
 
     os.makedirs(extract_dir, exist_ok=True)
 
-    gml_files = []
-    total_extracted = 0
+    # 抽出対象（ZIP内のエントリ情報, 展開先パス）のリスト
+    tasks = []
+    # 展開先で使用済みのファイル名と、ファイル名ごとに付与済みの連番
+    # macOS/Windowsのファイルシステムは大文字・小文字を区別しないため、casefoldした名前で管理する
+    used_names = set()
+    seen: Dict[str, int] = {}
 
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             # ZIP内の全ファイルを取得
-            all_files = zip_ref.namelist()
-
-            for file_path in all_files:
+            for zip_info in zip_ref.infolist():
                 # ディレクトリエントリはスキップ
-                if file_path.endswith('/'):
+                if zip_info.filename.endswith('/'):
                     continue
 
                 # ファイル名のみを取得（パス情報を除去）
-                file_name = os.path.basename(file_path)
+                file_name = os.path.basename(zip_info.filename)
 
                 # .gmlファイルのみを対象とする
                 if file_name.lower().endswith('.gml'):
-                    # フラット構造で配置（元のディレクトリ構造は無視）
-                    target_path = os.path.join(extract_dir, file_name)
-                    
                     # 同名ファイルがある場合は連番を付与
-                    counter = 1
-                    original_target_path = target_path
-                    while os.path.exists(target_path):
-                        name, ext = os.path.splitext(original_target_path)
-                        target_path = f"{name}_{counter}{ext}"
+                    # 前回付与した連番から再開するため、通常はループせずに決まる
+                    name_key = file_name.casefold()
+                    counter = seen.get(name_key, 0)
+                    target_name = file_name
+                    name, ext = os.path.splitext(file_name)
+                    while target_name.casefold() in used_names:
                         counter += 1
+                        target_name = f"{name}_{counter}{ext}"
+                    seen[name_key] = counter
+                    used_names.add(target_name.casefold())
+
+                    # フラット構造で配置（元のディレクトリ構造は無視）
+                    tasks.append((zip_info, os.path.join(extract_dir, target_name)))
 
-                    # ファイルを抽出
-                    with zip_ref.open(file_path) as source, open(target_path, 'wb') as target:
-                        shutil.copyfileobj(source, target)
+            # ファイルを抽出（ファイル数が少ない場合は解析済みのZIPファイルをそのまま使って逐次展開）
+            if len(tasks) < EXTRACT_PARALLEL_MIN_FILES:
+                for task in tasks:
+                    _extract_one(zip_ref, zip_path, task)
 
-                    gml_files.append(target_path)
-                    total_extracted += 1
-                    logger.debug(f"  抽出: {file_name}")
+        # ファイル数が多い場合はスレッドで並列に展開
+        if len(tasks) >= EXTRACT_PARALLEL_MIN_FILES:
+            _extract_parallel(zip_path, tasks)
+
+        gml_files = [target_path for _, target_path in tasks]
+        total_extracted = len(gml_files)
 
         logger.info(f"展開完了: {total_extracted}個のGMLファイルを抽出しました")
 
@@ -600,6 +1054,135 @@ async def _extract_gml_files_flat(zip_path: str) -> Dict[str, Any]:
         raise RuntimeError(error_msg)
 
 
+def _get_extract_dir(zip_path: str) -> str:
+    """ZIPファイルパスから展開先ディレクトリのパスを生成する"""
+    zip_name_without_ext = os.path.splitext(os.path.basename(zip_path))[0]
+    return os.path.join(os.path.dirname(zip_path), f"extract_{zip_name_without_ext}")
+
+
+def _list_extracted_gml_files(zip_path: str) -> Dict[str, Any]:
+    """
+    展開済みディレクトリのGMLファイル一覧を、`_extract_gml_files_flat`と同じ形式で返す内部ヘルパー関数。
+
+    Args:
+        zip_path (str): 展開元のZIPファイルパス。
+
+    Returns:
+        Dict[str, Any]: 展開結果の詳細情報
+    """
+    extract_dir = _get_extract_dir(zip_path)
+    gml_files = sorted(
+        entry.path for entry in os.scandir(extract_dir)
+        if entry.is_file() and entry.name.lower().endswith('.gml')
+    )
+    return {
+        "extract_dir": extract_dir,
+        "gml_files": gml_files,
+        "total_files": len(gml_files),
+        "zip_filename": os.path.basename(zip_path),
+        "success": True
+    }
+
+
+def _extract_parallel(zip_path: str, tasks: List[Tuple[zipfile.ZipInfo, str]]) -> None:
+    """
+    ZIPファイルから複数のファイルをスレッドで並列に抽出する内部ヘルパー関数。
+
+    スレッド間でファイルハンドルを共有しないよう、ZIPファイルはワーカースレッドごとに1回だけ開きます
+    （セントラルディレクトリの解析をエントリごとに繰り返さないため）。
+
+    Args:
+        zip_path (str): ZIPファイルパス。
+        tasks (List[Tuple[zipfile.ZipInfo, str]]): （ZIP内のエントリ情報, 展開先パス）のリスト。
+    """
+    local = threading.local()
+    opened: List[zipfile.ZipFile] = []
+    opened_lock = threading.Lock()
+
+    def extract(task: Tuple[zipfile.ZipInfo, str]) -> None:
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(zip_path, 'r')
+            local.zip_ref = zip_ref
+            with opened_lock:
+                opened.append(zip_ref)
+        _extract_one(zip_ref, zip_path, task)
+
+    max_workers = min(EXTRACT_MAX_WORKERS, os.cpu_count() or 4)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(extract, tasks))
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
+
+
+def _extract_one(zip_ref: zipfile.ZipFile, zip_path: str, task: Tuple[zipfile.ZipInfo, str]) -> None:
+    """
+    ZIPファイルから1ファイルを抽出する内部ヘルパー関数。
+
+    Args:
+        zip_ref (zipfile.ZipFile): 呼び出し元スレッドが開いているZIPファイル。
+        zip_path (str): ZIPファイルパス。
+        task (Tuple[zipfile.ZipInfo, str]): （ZIP内のエントリ情報, 展開先パス）。
+    """
+    zip_info, target_path = task
+    # 無圧縮のエントリはカーネル内でコピーし、できない場合は通常の展開にフォールバック
+    if not _copy_stored_entry(zip_path, zip_info, target_path):
+        with zip_ref.open(zip_info) as source, open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, length=EXTRACT_BUFFER_SIZE)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("  抽出: %s", os.path.basename(zip_info.filename))
+
+
+def _copy_stored_entry(zip_path: str, zip_info: zipfile.ZipInfo, target_path: str) -> bool:
+    """
+    無圧縮（ZIP_STORED）のエントリを`os.copy_file_range`でコピーする内部ヘルパー関数。
+
+    データがユーザ空間のバッファを経由しないため、大きなGMLファイルを効率よく展開できます。
+
+    Args:
+        zip_path (str): ZIPファイルパス。
+        zip_info (zipfile.ZipInfo): コピー対象のエントリ情報。
+        target_path (str): 展開先パス。
+
+    Returns:
+        bool: コピーした場合はTrue。圧縮・暗号化されたエントリや、
+              `os.copy_file_range`が利用できない環境の場合はFalse。
+    """
+    if (
+        zip_info.compress_type != zipfile.ZIP_STORED
+        or zip_info.flag_bits & 0x1  # 暗号化
+        or not hasattr(os, "copy_file_range")
+    ):
+        return False
+
+    with open(zip_path, 'rb') as source:
+        # ローカルファイルヘッダーの長さはセントラルディレクトリと異なる場合があるため実際に読み取る
+        source.seek(zip_info.header_offset)
+        header = source.read(zipfile.sizeFileHeader)
+        if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+            return False
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        offset = zip_info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+
+        try:
+            with open(target_path, 'wb') as target:
+                remaining = zip_info.file_size
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), remaining, offset_src=offset)
+                    if copied == 0:
+                        raise OSError(f"ZIPエントリのデータが途中で終了しています: {zip_info.filename}")
+                    offset += copied
+                    remaining -= copied
+        except OSError as e:
+            # ファイルシステムが未対応の場合などは通常の展開にフォールバック
+            logger.debug("copy_file_range失敗、通常の展開で再試行: %s", e)
+            return False
+
+    return True
+
+
 def main():
     # stdio経由でMCPサーバーを起動
     mcp.run(transport="stdio")
@@ -0,0 +1,121 @@
+import asyncio
+import io
+import json
+import os
+import zipfile
+
+import httpx
+import pytest
+
+from plateau_api_mcp import plateau_api
+
+ETAG = '"pack-1"'
+DOWNLOAD_URL = "https://example.com/files/pack.zip"
+
+
+def _make_zip() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr("udx/bldg/53394611_bldg_6697_op.gml", "<gml/>")
+        zip_ref.writestr("udx/bldg/README.txt", "not a gml")
+    return buffer.getvalue()
+
+
+def test_download_files_reuses_cached_zip_on_304(tmp_path, monkeypatch):
+    body = _make_zip()
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == ETAG:
+            return httpx.Response(304, headers={"etag": ETAG})
+        return httpx.Response(200, headers={"etag": ETAG}, content=body)
+
+    monkeypatch.setattr(plateau_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def run():
+        first = await plateau_api.download_files(DOWNLOAD_URL, str(tmp_path))
+
+        # 2回目は展開をやり直さず、展開済みのディレクトリを再利用すること
+        async def fail_extract(zip_path):
+            raise AssertionError("展開済みのディレクトリが再利用されていません")
+
+        monkeypatch.setattr(plateau_api, "_extract_gml_files_flat", fail_extract)
+        second = await plateau_api.download_files(DOWNLOAD_URL, str(tmp_path))
+        await plateau_api._close_client()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first["cached"] is False
+    assert os.path.exists(f"{first['zip_path']}.meta.json")
+    assert first["extract_result"]["total_files"] == 1
+
+    assert requests[1].headers["if-none-match"] == ETAG
+    assert second["cached"] is True
+    assert second["zip_path"] == first["zip_path"]
+    assert second["extract_result"]["extract_dir"] == first["extract_result"]["extract_dir"]
+    assert second["extract_result"]["gml_files"] == first["extract_result"]["gml_files"]
+    with open(second["zip_path"], "rb") as f:
+        assert f.read() == body
+
+
+def test_download_files_keeps_existing_zip_when_stream_fails(tmp_path, monkeypatch):
+    save_path = tmp_path / "pack.zip"
+    save_path.write_bytes(b"previous zip")
+
+    async def broken_body():
+        yield b"partial"
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"etag": ETAG}, content=broken_body())
+
+    monkeypatch.setattr(plateau_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def run():
+        try:
+            await plateau_api.download_files(DOWNLOAD_URL, str(tmp_path), auto_extract=False)
+        finally:
+            await plateau_api._close_client()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+    assert save_path.read_bytes() == b"previous zip"
+    assert not os.path.exists(f"{save_path}.part")
+
+
+def test_download_files_keeps_cache_entry_when_redownload_fails(tmp_path, monkeypatch):
+    body = _make_zip()
+    responses = iter(["ok", "changed"])
+
+    async def broken_body():
+        yield body[:10]
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if next(responses) == "ok":
+            return httpx.Response(200, headers={"etag": ETAG}, content=body)
+        # ETagが変わった新しいZIPの取得途中で失敗する
+        return httpx.Response(200, headers={"etag": '"pack-2"'}, content=broken_body())
+
+    monkeypatch.setattr(plateau_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def run():
+        try:
+            first = await plateau_api.download_files(DOWNLOAD_URL, str(tmp_path), auto_extract=False)
+            with pytest.raises(RuntimeError):
+                await plateau_api.download_files(DOWNLOAD_URL, str(tmp_path), auto_extract=False)
+            return first
+        finally:
+            await plateau_api._close_client()
+
+    first = asyncio.run(run())
+
+    with open(first["zip_path"], "rb") as f:
+        assert f.read() == body
+    with open(f"{first['zip_path']}.meta.json", encoding="utf-8") as f:
+        meta = json.load(f)
+    assert meta["etag"] == ETAG
+    assert meta["size"] == len(body)
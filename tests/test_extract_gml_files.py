@@ -0,0 +1,57 @@
+import os
+import zipfile
+
+from plateau_api_mcp import plateau_api
+
+
+def test_extract_gml_files_flat_gives_each_entry_its_own_file(tmp_path):
+    zip_path = tmp_path / "pack.zip"
+    entries = {
+        "x/A.gml": "upper",
+        "y/a.gml": "lower",
+        "z/a.gml": "duplicate",
+        "w/a_1.gml": "literal suffix",
+        "w/B.GML": "b",
+        "w/readme.txt": "skipped",
+    }
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zip_ref:
+        for name, content in entries.items():
+            zip_ref.writestr(name, content)
+
+    result = plateau_api._extract_gml_files_flat_sync(str(zip_path))
+
+    gml_files = result["gml_files"]
+    assert result["total_files"] == 5
+    # 大文字・小文字を区別しないファイルシステムでも衝突しない名前であること
+    assert len({os.path.basename(path).casefold() for path in gml_files}) == 5
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        gml_entries = [name for name in zip_ref.namelist() if name.lower().endswith(".gml")]
+        for entry, path in zip(gml_entries, gml_files):
+            with open(path, "rb") as f:
+                assert f.read() == zip_ref.read(entry)
+
+
+def test_extract_gml_files_flat_opens_archive_once_per_worker(tmp_path, monkeypatch):
+    zip_path = tmp_path / "pack.zip"
+    gml_count = 50
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        for i in range(2000):
+            zip_ref.writestr(f"appearance/tex_{i}.jpg", b"")
+        for i in range(gml_count):
+            zip_ref.writestr(f"udx/bldg/{i}_bldg.gml", f"<gml id='{i}'/>")
+
+    opened = []
+    original_zip_file = zipfile.ZipFile
+
+    class CountingZipFile(original_zip_file):
+        def __init__(self, *args, **kwargs):
+            opened.append(args[0] if args else kwargs.get("file"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(plateau_api.zipfile, "ZipFile", CountingZipFile)
+
+    result = plateau_api._extract_gml_files_flat_sync(str(zip_path))
+
+    assert result["total_files"] == gml_count
+    # 計画用の1回 + ワーカースレッドごとに1回まで（エントリごとには開かない）
+    assert len(opened) <= 1 + plateau_api.EXTRACT_MAX_WORKERS
@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+import pytest
+
+from plateau_api_mcp import plateau_api
+
+
+def _run_with_transport(monkeypatch, handler, coro_factory):
+    monkeypatch.setattr(plateau_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(plateau_api, "_retry_delay", lambda attempt, retry_after=None: 0)
+
+    async def run():
+        try:
+            return await coro_factory()
+        finally:
+            await plateau_api._close_client()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("error", [httpx.ReadTimeout("timeout"), httpx.Response(503)])
+def test_fetch_api_does_not_retry_post(monkeypatch, error):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if isinstance(error, Exception):
+            raise error
+        return error
+
+    with pytest.raises((httpx.TransportError, RuntimeError)):
+        _run_with_transport(
+            monkeypatch, handler,
+            lambda: plateau_api.fetch_api("/citygml/pack", method="POST", json_body={"urls": []})
+        )
+
+    assert len(requests) == 1
+
+
+def test_fetch_api_retries_get_on_transport_error(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) < 3:
+            raise httpx.ReadTimeout("timeout", request=request)
+        return httpx.Response(200, json={"status": "succeeded"})
+
+    result = _run_with_transport(monkeypatch, handler, lambda: plateau_api.fetch_api("/citygml/pack/abc/status"))
+
+    assert result == {"status": "succeeded"}
+    assert len(requests) == 3
@@ -0,0 +1,48 @@
+import asyncio
+
+import httpx
+import pytest
+
+from plateau_api_mcp import plateau_api
+
+CATALOG = {"cities": [{"files": {"bldg": [{"url": "https://example.com/53394611_bldg.gml"}]}}]}
+
+
+def _run_with_transport(monkeypatch, handler, coro_factory):
+    monkeypatch.setattr(plateau_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(plateau_api, "_cache", {})
+    monkeypatch.setattr(plateau_api, "_retry_delay", lambda attempt, retry_after=None: 0)
+
+    async def run():
+        try:
+            return await coro_factory()
+        finally:
+            await plateau_api._close_client()
+
+    return asyncio.run(run())
+
+
+def test_get_list_citygml_reports_failed_conditions(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("m:53394611"):
+            return httpx.Response(200, json=CATALOG)
+        return httpx.Response(404, text="not found")
+
+    result = _run_with_transport(
+        monkeypatch, handler,
+        lambda: plateau_api.get_list_citygml(["m:53394611", "m:00000000"], "bldg")
+    )
+
+    assert result["urls"] == ["https://example.com/53394611_bldg.gml"]
+    assert list(result["failed_conditions"]) == ["m:00000000"]
+
+
+def test_get_list_citygml_raises_when_all_conditions_fail(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, text="unavailable")
+
+    with pytest.raises(RuntimeError):
+        _run_with_transport(
+            monkeypatch, handler,
+            lambda: plateau_api.get_list_citygml(["m:53394611", "m:53394612"], "bldg")
+        )